@@ -65,6 +65,9 @@ from .globals import request_ctx
 from .globals import session
 from .globals import websocket
 from .globals import websocket_ctx
+from .helpers import _IMMUTABLE_MAX_AGE
+from .helpers import _static_folder_path
+from .helpers import _total_seconds
 from .helpers import get_debug_flag
 from .helpers import get_flashed_messages
 from .helpers import send_from_directory
@@ -259,6 +262,7 @@ class Quart(App):
             "RESPONSE_TIMEOUT": 60,  # Second
             "SECRET_KEY": None,
             "SECRET_KEY_FALLBACKS": None,
+            "SEND_FILE_CACHE_SIZE": 0,  # Bytes, 0 to disable
             "SEND_FILE_MAX_AGE_DEFAULT": timedelta(hours=12),
             "SERVER_NAME": None,
             "SESSION_COOKIE_DOMAIN": None,
@@ -269,6 +273,7 @@ class Quart(App):
             "SESSION_COOKIE_SAMESITE": None,
             "SESSION_COOKIE_SECURE": False,
             "SESSION_REFRESH_EACH_REQUEST": True,
+            "STATIC_IMMUTABLE": False,
             "TEMPLATES_AUTO_RELOAD": None,
             "TESTING": False,
             "TRAP_BAD_REQUEST_ERRORS": None,
@@ -359,6 +364,19 @@ class Quart(App):
                 host=static_host,
             )
 
+    @property
+    def static_folder(self) -> str | None:
+        """The absolute path to the configured static folder. ``None``
+        if no static folder is set.
+        """
+        if self._static_folder is None:
+            return None
+        return _static_folder_path(self.root_path, self._static_folder)
+
+    @static_folder.setter
+    def static_folder(self, value: str | os.PathLike[str] | None) -> None:
+        App.static_folder.fset(self, value)  # type: ignore[attr-defined]
+
     def get_send_file_max_age(self, filename: str | None) -> int | None:
         """Used by :func:`send_file` to determine the ``max_age`` cache
         value for a given file path if it wasn't passed.
@@ -378,15 +396,27 @@ class Quart(App):
             return None
 
         if isinstance(value, timedelta):
-            return int(value.total_seconds())
+            return _total_seconds(value)
 
         return value
         return None
 
     async def send_static_file(self, filename: str) -> Response:
-        if not self.has_static_folder:
+        static_folder = self.static_folder
+        if static_folder is None:
             raise RuntimeError("No static folder for this object")
-        return await send_from_directory(self.static_folder, filename)
+        if self.config["STATIC_IMMUTABLE"]:
+            # The files are assumed to be fingerprinted, hence they are
+            # never revalidated and an etag is of no use.
+            response = await send_from_directory(
+                static_folder,
+                filename,
+                add_etags=False,
+                cache_timeout=_IMMUTABLE_MAX_AGE,
+            )
+            response.cache_control.immutable = True
+            return response
+        return await send_from_directory(static_folder, filename)
 
     async def open_resource(
         self,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import warnings
 from functools import partial
 from typing import AnyStr
@@ -11,6 +12,7 @@ from urllib.parse import urlparse
 
 from hypercorn.typing import ASGIReceiveCallable
 from hypercorn.typing import ASGISendCallable
+from hypercorn.typing import ASGISendEvent
 from hypercorn.typing import HTTPResponseBodyEvent
 from hypercorn.typing import HTTPResponseStartEvent
 from hypercorn.typing import HTTPScope
@@ -37,6 +39,7 @@ from .utils import raise_task_exceptions
 from .wrappers import Request  # noqa: F401
 from .wrappers import Response  # noqa: F401
 from .wrappers import Websocket  # noqa: F401
+from .wrappers.response import FileBody
 
 if TYPE_CHECKING:
     from .app import Quart  # noqa: F401
@@ -132,6 +135,29 @@ class ASGIHTTPConnection:
             )
         )
 
+        extensions = self.scope.get("extensions", {}) or {}
+        # Only the stock FileBody is sent directly, as subclasses may
+        # alter the body whilst iterating.
+        if isinstance(response, Response) and type(response.response) is FileBody:
+            file_body = response.response
+            # The pathsend extension can only send the whole file.
+            if "http.response.pathsend" in extensions and (
+                file_body.begin == 0 and file_body.end == file_body.size
+            ):
+                await send(
+                    cast(
+                        ASGISendEvent,
+                        {
+                            "type": "http.response.pathsend",
+                            "path": os.path.abspath(file_body.file_path),
+                        },
+                    )
+                )
+                return
+            elif "http.response.zerocopysend" in extensions:
+                await self._send_zerocopy(send, file_body)
+                return
+
         if isinstance(response, WerkzeugResponse):
             for data in response.response:
                 body = data.encode() if isinstance(data, str) else data
@@ -162,6 +188,24 @@ class ASGIHTTPConnection:
             )
         )
 
+    async def _send_zerocopy(self, send: ASGISendCallable, file_body: FileBody) -> None:
+        file_ = await asyncio.to_thread(open, file_body.file_path, "rb")
+        try:
+            await send(
+                cast(
+                    ASGISendEvent,
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": file_,
+                        "offset": file_body.begin,
+                        "count": file_body.end - file_body.begin,
+                        "more_body": False,
+                    },
+                )
+            )
+        finally:
+            file_.close()
+
     async def _send_push_promise(
         self, send: ASGISendCallable, path: str, headers: Headers
     ) -> None:
@@ -14,6 +14,9 @@ from flask.sansio.scaffold import setupmethod
 
 from .cli import AppGroup
 from .globals import current_app
+from .helpers import _IMMUTABLE_MAX_AGE
+from .helpers import _static_folder_path
+from .helpers import _total_seconds
 from .helpers import send_from_directory
 from .typing import AfterServingCallable
 from .typing import AfterWebsocketCallable
@@ -63,6 +66,19 @@ class Blueprint(SansioBlueprint):
             AppOrBlueprintKey, list[TeardownCallable]
         ] = defaultdict(list)
 
+    @property
+    def static_folder(self) -> str | None:
+        """The absolute path to the configured static folder. ``None``
+        if no static folder is set.
+        """
+        if self._static_folder is None:
+            return None
+        return _static_folder_path(self.root_path, self._static_folder)
+
+    @static_folder.setter
+    def static_folder(self, value: str | os.PathLike[str] | None) -> None:
+        SansioBlueprint.static_folder.fset(self, value)  # type: ignore[attr-defined]
+
     def get_send_file_max_age(self, filename: str | None) -> int | None:
         """Used by :func:`send_file` to determine the ``max_age`` cache
         value for a given file path if it wasn't passed.
@@ -82,15 +98,27 @@ class Blueprint(SansioBlueprint):
             return None
 
         if isinstance(value, timedelta):
-            return int(value.total_seconds())
+            return _total_seconds(value)
 
         return value
         return None
 
     async def send_static_file(self, filename: str) -> Response:
-        if not self.has_static_folder:
+        static_folder = self.static_folder
+        if static_folder is None:
             raise RuntimeError("No static folder for this object")
-        return await send_from_directory(self.static_folder, filename)
+        if current_app.config["STATIC_IMMUTABLE"]:
+            # The files are assumed to be fingerprinted, hence they are
+            # never revalidated and an etag is of no use.
+            response = await send_from_directory(
+                static_folder,
+                filename,
+                add_etags=False,
+                cache_timeout=_IMMUTABLE_MAX_AGE,
+            )
+            response.cache_control.immutable = True
+            return response
+        return await send_from_directory(static_folder, filename)
 
     async def open_resource(
         self,
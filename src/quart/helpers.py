@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import mimetypes
 import os
 import pkgutil
+import stat
 import sys
+from collections import OrderedDict
 from collections.abc import Iterable
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 from functools import cache
+from functools import lru_cache
 from functools import wraps
 from io import BytesIO
 from pathlib import Path
@@ -16,7 +20,6 @@ from typing import Any
 from typing import Callable
 from typing import cast
 from typing import NoReturn
-from zlib import adler32
 
 from flask.helpers import get_root_path as get_root_path  # noqa: F401
 from werkzeug.exceptions import abort as werkzeug_abort
@@ -25,6 +28,7 @@ from werkzeug.utils import redirect as werkzeug_redirect
 from werkzeug.utils import safe_join
 from werkzeug.wrappers import Response as WerkzeugResponse
 
+from .globals import _cv_app
 from .globals import _cv_request
 from .globals import current_app
 from .globals import request
@@ -34,11 +38,12 @@ from .signals import message_flashed
 from .typing import FilePath
 from .typing import ResponseReturnValue
 from .typing import ResponseTypes
-from .utils import file_path_to_path
 from .wrappers import Response
+from .wrappers.response import FileBody
 from .wrappers.response import ResponseBody
 
 DEFAULT_MIMETYPE = "application/octet-stream"
+_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60  # Second
 
 locked_cached_property = property
 
@@ -280,11 +285,14 @@ async def send_from_directory(
 
     See :func:`send_file` for the other arguments.
     """
-    raw_file_path = safe_join(str(directory), file_name)
-    if raw_file_path is None:
+    file_path = safe_join(os.fsdecode(directory), file_name)
+    if file_path is None:
         raise NotFound()
-    file_path = Path(raw_file_path)
-    if not file_path.is_file():
+    try:
+        stat_result = os.stat(file_path)
+    except (OSError, ValueError):
+        raise NotFound() from None
+    if not stat.S_ISREG(stat_result.st_mode):
         raise NotFound()
     return await send_file(
         file_path,
@@ -295,6 +303,7 @@ async def send_from_directory(
         cache_timeout=cache_timeout,
         conditional=conditional,
         last_modified=last_modified,
+        stat_result=stat_result,
     )
 
 
@@ -307,6 +316,7 @@ async def send_file(
     cache_timeout: int | None = None,
     conditional: bool = False,
     last_modified: datetime | None = None,
+    stat_result: os.stat_result | None = None,
 ) -> Response:
     """Return a Response to send the filename given.
 
@@ -322,38 +332,41 @@ async def send_file(
             modification time.
         last_modified: Used to override the last modified value.
         cache_timeout: Time in seconds for the response to be cached.
+        stat_result: The result of :func:`os.stat` for the file, if
+            already known, to save a stat call.
 
     """
+    app = current_app._get_current_object()  # type: ignore
+    response_class = app.response_class
     file_body: ResponseBody
     file_size: int | None = None
     etag: str | None = None
     if isinstance(filename_or_io, BytesIO):
-        file_body = current_app.response_class.io_body_class(filename_or_io)
+        file_body = response_class.io_body_class(filename_or_io)
         file_size = filename_or_io.getbuffer().nbytes
     else:
-        file_path = file_path_to_path(filename_or_io)
-        file_size = file_path.stat().st_size
+        file_path = os.fsdecode(filename_or_io)
+        if stat_result is None:
+            stat_result = os.stat(file_path)
+        file_size = stat_result.st_size
         if attachment_filename is None:
-            attachment_filename = file_path.name
-        file_body = current_app.response_class.file_body_class(file_path)
+            attachment_filename = os.path.basename(file_path)
+        file_body = response_class.file_body_class(file_path, size=file_size)
         if last_modified is None:
-            last_modified = file_path.stat().st_mtime  # type: ignore
+            last_modified = stat_result.st_mtime  # type: ignore
         if cache_timeout is None:
-            cache_timeout = current_app.get_send_file_max_age(str(file_path))
-        etag = (
-            f"{file_path.stat().st_mtime}-{file_path.stat().st_size}"
-            f"-{adler32(bytes(file_path))}"
-        )
+            cache_timeout = app.get_send_file_max_age(file_path)
+        etag = _file_etag(stat_result)
 
     if mimetype is None and attachment_filename is not None:
-        mimetype = mimetypes.guess_type(attachment_filename)[0] or DEFAULT_MIMETYPE
+        mimetype = _guess_mimetype(_mimetype_suffixes(attachment_filename))
     if mimetype is None:
         raise ValueError(
             "The mime type cannot be inferred, please set it manually via the"
             " mimetype argument."
         )
 
-    response = current_app.response_class(file_body, mimetype=mimetype)
+    response = response_class(file_body, mimetype=mimetype)
     response.content_length = file_size
 
     if as_attachment:
@@ -376,9 +389,100 @@ async def send_file(
         await response.make_conditional(
             request, accept_ranges=True, complete_length=file_size
         )
+
+    # The file is only read into the cache if the body is still to be
+    # sent, i.e. not if the response is not modified (304).
+    cache_size = app.config["SEND_FILE_CACHE_SIZE"]
+    if (
+        cache_size
+        and response.response is file_body
+        # Subclasses may alter the body whilst iterating.
+        and type(file_body) is FileBody
+        and file_size <= min(cache_size, _FILE_CACHE_MAX_FILE_SIZE)
+    ):
+        key = (file_path, stat_result.st_mtime_ns, file_size)
+        data = _file_cache.get(key)
+        if data is None:
+            data = await asyncio.to_thread(_read_file, file_path)
+            _file_cache.set(key, data, cache_size)
+        data_body = response_class.data_body_class(data)
+        data_body.begin = file_body.begin
+        data_body.end = file_body.end
+        response.response = data_body
     return response
 
 
+@lru_cache(maxsize=64)
+def _static_folder_path(root_path: str, static_folder: str) -> str:
+    return os.path.join(root_path, static_folder)
+
+
+@lru_cache(maxsize=32)
+def _total_seconds(value: timedelta) -> int:
+    return int(value.total_seconds())
+
+
+_FILE_CACHE_MAX_FILE_SIZE = 256 * 1024
+
+
+class _FileCache:
+    """A least recently used cache of file contents, bounded in bytes.
+
+    Entries are keyed by the path, modification time and size so that
+    a changed file is never served from the cache.
+    """
+
+    def __init__(self) -> None:
+        self._data: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+        self.size = 0
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.size = 0
+
+    def get(self, key: tuple[str, int, int]) -> bytes | None:
+        data = self._data.get(key)
+        if data is not None:
+            self._data.move_to_end(key)
+        return data
+
+    def set(self, key: tuple[str, int, int], data: bytes, max_size: int) -> None:
+        if key in self._data or len(data) > max_size:
+            return
+        self._data[key] = data
+        self.size += len(data)
+        while self.size > max_size:
+            _, evicted = self._data.popitem(last=False)
+            self.size -= len(evicted)
+
+
+_file_cache = _FileCache()
+
+
+def _read_file(file_path: str) -> bytes:
+    with open(file_path, "rb") as file_:
+        return file_.read()
+
+
+def _mimetype_suffixes(filename: str) -> str:
+    # The mimetypes module strips at most one encoding suffix (e.g.
+    # .gz) before looking up the type, hence the guess depends only
+    # on the last two suffixes.
+    root, suffix = os.path.splitext(filename)
+    return os.path.splitext(root)[1] + suffix
+
+
+def _file_etag(stat_result: os.stat_result) -> str:
+    # ETags are compared per URL, hence the modification time and size
+    # suffice to identify a version of the file without any hashing.
+    return f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+
+
+@lru_cache(maxsize=512)
+def _guess_mimetype(suffixes: str) -> str:
+    return mimetypes.guess_type(f"file{suffixes}")[0] or DEFAULT_MIMETYPE
+
+
 @cache
 def _split_blueprint_path(name: str) -> list[str]:
     bps = [name]
@@ -389,15 +493,15 @@ def _split_blueprint_path(name: str) -> list[str]:
 
 def abort(code: int | Response, *args: Any, **kwargs: Any) -> NoReturn:
     """Raise an HTTPException for the given status code."""
-    if current_app:
-        current_app.aborter(code, *args, **kwargs)
+    if (ctx := _cv_app.get(None)) is not None:
+        ctx.app.aborter(code, *args, **kwargs)
 
     werkzeug_abort(code, *args, **kwargs)
 
 
 def redirect(location: str, code: int = 302) -> WerkzeugResponse:
     """Redirect to the location with the status code."""
-    if current_app:
-        return current_app.redirect(location, code=code)
+    if (ctx := _cv_app.get(None)) is not None:
+        return ctx.app.redirect(location, code=code)
 
     return werkzeug_redirect(location, code=code)
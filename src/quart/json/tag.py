@@ -1,10 +1,165 @@
-from flask.json.tag import JSONTag as JSONTag  # noqa: F401
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Callable
+
+from flask.json.tag import JSONTag as JSONTag
 from flask.json.tag import PassDict as PassDict  # noqa: F401
 from flask.json.tag import PassList as PassList  # noqa: F401
-from flask.json.tag import TagBytes as TagBytes  # noqa: F401
-from flask.json.tag import TagDateTime as TagDateTime  # noqa: F401
+from flask.json.tag import TagBytes as _FlaskTagBytes
+from flask.json.tag import TagDateTime as _FlaskTagDateTime
 from flask.json.tag import TagDict as TagDict  # noqa: F401
-from flask.json.tag import TaggedJSONSerializer as TaggedJSONSerializer  # noqa: F401
+from flask.json.tag import TaggedJSONSerializer as _FlaskTaggedJSONSerializer
 from flask.json.tag import TagMarkup as TagMarkup  # noqa: F401
 from flask.json.tag import TagTuple as TagTuple  # noqa: F401
 from flask.json.tag import TagUUID as TagUUID  # noqa: F401
+from werkzeug.http import parse_date
+
+try:
+    from pybase64 import b64decode
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64decode
+    from base64 import b64encode
+
+
+class TagBytes(_FlaskTagBytes):
+    """Tag for bytes values.
+
+    This uses the SIMD accelerated pybase64 if it is installed,
+    falling back to the stdlib base64 module. The output is identical
+    either way.
+    """
+
+    __slots__ = ()
+
+    def to_json(self, value: Any) -> Any:
+        return b64encode(value).decode("ascii")
+
+    def to_python(self, value: Any) -> Any:
+        return b64decode(value)
+
+
+_MONTHS = {
+    month: index
+    for index, month in enumerate(
+        (
+            "Jan",
+            "Feb",
+            "Mar",
+            "Apr",
+            "May",
+            "Jun",
+            "Jul",
+            "Aug",
+            "Sep",
+            "Oct",
+            "Nov",
+            "Dec",
+        ),
+        start=1,
+    )
+}
+
+
+class TagDateTime(_FlaskTagDateTime):
+    """Tag for datetime values.
+
+    Values are serialised as HTTP dates, e.g. ``Wed, 21 Oct 2015
+    07:28:00 GMT``. As this is a fixed width format it is parsed
+    directly, with a fallback to the general RFC 2822 parser for any
+    other form.
+    """
+
+    __slots__ = ()
+
+    def to_python(self, value: Any) -> Any:
+        if len(value) == 29 and value[3:5] == ", " and value[25:] == " GMT":
+            try:
+                return datetime(
+                    int(value[12:16]),
+                    _MONTHS[value[8:11]],
+                    int(value[5:7]),
+                    int(value[17:19]),
+                    int(value[20:22]),
+                    int(value[23:25]),
+                    tzinfo=timezone.utc,
+                )
+            except (KeyError, ValueError):
+                pass
+        return parse_date(value)
+
+
+_REPLACED_TAGS = {_FlaskTagBytes: TagBytes, _FlaskTagDateTime: TagDateTime}
+
+
+def _untagged(value: Any) -> Any:
+    return value
+
+
+class TaggedJSONSerializer(_FlaskTaggedJSONSerializer):
+    __slots__ = ("_type_dispatch",)
+
+    default_tags = [
+        _REPLACED_TAGS.get(tag, tag) for tag in _FlaskTaggedJSONSerializer.default_tags
+    ]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._type_dispatch: dict[type, Callable[[Any], Any]] = {}
+        # Other tags may claim values of these types, so the dispatch
+        # is only valid for the default tags.
+        if self.default_tags is TaggedJSONSerializer.default_tags:
+            self._type_dispatch = {
+                str: _untagged,
+                int: _untagged,
+                float: _untagged,
+                bool: _untagged,
+                type(None): _untagged,
+                dict: self._tag_dict,
+                list: self._tag_list,
+            }
+
+    def register(
+        self,
+        tag_class: type[JSONTag],
+        force: bool = False,
+        index: int | None = None,
+    ) -> None:
+        super().register(tag_class, force, index)
+        # A custom tag may claim values of any type, so every value
+        # must go through the tag order checks from now on.
+        self._type_dispatch = {}
+
+    def tag(self, value: Any) -> Any:
+        """Convert a value to a tagged representation if necessary.
+
+        Values of the exact builtin types the default tags pass
+        through are dispatched on their type, skipping the checks of
+        each tag in order. Subclasses and any other types are checked
+        as usual.
+        """
+        tagger = self._type_dispatch.get(type(value))
+        if tagger is None:
+            return super().tag(value)
+        return tagger(value)
+
+    def _tag_dict(self, value: dict) -> Any:
+        if len(value) == 1 and next(iter(value)) in self.tags:
+            return super().tag(value)
+        return {key: self.tag(item) for key, item in value.items()}
+
+    def _tag_list(self, value: list) -> Any:
+        return [self.tag(item) for item in value]
+
+    def loads(self, value: str) -> Any:
+        """Load data from a JSON string and deserialise any tagged objects.
+
+        The decoder calls the object hook for each object after its
+        members have been decoded, which untags the data in the same
+        order as a recursive scan without any Python level recursion.
+        """
+        return json.loads(value, object_hook=self.untag)
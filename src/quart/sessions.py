@@ -1,26 +1,64 @@
 from __future__ import annotations
 
+import binascii
 import hashlib
+import hmac
+import struct
+import time
 from datetime import datetime
 from datetime import timezone
+from typing import Any
+from typing import Callable
 from typing import TYPE_CHECKING
 
 from flask.sessions import NullSession as NullSession  # noqa: F401
-from flask.sessions import SecureCookieSession as SecureCookieSession  # noqa: F401
-from flask.sessions import (  # noqa: F401
-    session_json_serializer as session_json_serializer,
-)
+from flask.sessions import SecureCookieSession as _FlaskSecureCookieSession
 from flask.sessions import SessionMixin as SessionMixin  # noqa: F401
 from itsdangerous import BadSignature
 from itsdangerous import URLSafeTimedSerializer
+from itsdangerous.encoding import want_bytes
 from werkzeug.wrappers import Response as WerkzeugResponse
 
+from .json.tag import TaggedJSONSerializer
 from .wrappers import BaseRequestWebsocket
 from .wrappers import Response
 
+try:
+    from pybase64 import urlsafe_b64decode
+    from pybase64 import urlsafe_b64encode
+except ImportError:
+    from base64 import urlsafe_b64decode
+    from base64 import urlsafe_b64encode
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 if TYPE_CHECKING:
     from .app import Quart  # noqa
 
+session_json_serializer = TaggedJSONSerializer()
+
+_VERIFIED_COOKIES_MAX_SIZE = 512
+
+
+class SecureCookieSession(_FlaskSecureCookieSession):
+    """Base class for sessions based on signed cookies.
+
+    Item assignment and deletion are the most common mutations, so
+    these set :attr:`modified` directly rather than via the generic
+    update callback wrapper.
+    """
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        self.modified = True
+
+    def __delitem__(self, key: str) -> None:
+        dict.__delitem__(self, key)
+        self.modified = True
+
 
 class SessionInterface:
     """Base class for session interfaces.
@@ -133,9 +171,16 @@ class SecureCookieSessionInterface(SessionInterface):
 
     This will store the data on the cookie in plain text, but with a
     signature to prevent modification.
+
+    Attributes:
+        digest_method: The hash function used to sign the cookie.
+        fallback_digest_methods: Hash functions also accepted when
+            verifying a cookie, allowing cookies signed before a
+            change of :attr:`digest_method` to remain valid.
     """
 
-    digest_method = staticmethod(hashlib.sha1)
+    digest_method = staticmethod(hashlib.sha256)
+    fallback_digest_methods: tuple[Callable[..., Any], ...] = (hashlib.sha1,)
     key_derivation = "hmac"
     salt = "cookie-session"
     serializer = session_json_serializer
@@ -145,6 +190,8 @@ class SecureCookieSessionInterface(SessionInterface):
         """Return a serializer for the session that also signs data.
 
         This will return None if the app is not configured for secrets.
+        The serializer for the current secret keys is cached, as it is
+        otherwise identical on every request.
         """
         if not app.secret_key:
             return None
@@ -154,16 +201,29 @@ class SecureCookieSessionInterface(SessionInterface):
         if fallbacks := app.config["SECRET_KEY_FALLBACKS"]:
             keys.extend(fallbacks)
 
+        # Only the serializer for the current keys is kept, and it is
+        # stored lazily as subclasses may not call __init__.
+        cache_key = tuple(keys)
+        cached_key, cached = self.__dict__.get("_signing_serializer", (None, None))
+        if cached_key == cache_key:
+            return cached
+
         options = {
             "key_derivation": self.key_derivation,
             "digest_method": self.digest_method,
         }
-        return URLSafeTimedSerializer(
+        serializer = URLSafeTimedSerializer(
             keys,  # type: ignore[arg-type]
             salt=self.salt,
             serializer=self.serializer,
             signer_kwargs=options,
+            fallback_signers=[
+                {**options, "digest_method": digest_method}
+                for digest_method in self.fallback_digest_methods
+            ],
         )
+        self._signing_serializer = (cache_key, serializer)
+        return serializer
 
     async def open_session(
         self, app: Quart, request: BaseRequestWebsocket
@@ -173,20 +233,78 @@ class SecureCookieSessionInterface(SessionInterface):
         This will return None if a signing serializer is not available,
         usually if the config SECRET_KEY is not set.
         """
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie is None:
+            # Nothing to verify, so the signer is only needed if there
+            # is no secret key and hence no session.
+            if not app.secret_key:
+                return None
+            return self.session_class()
+
         signer = self.get_signing_serializer(app)
         if signer is None:
             return None
 
-        cookie = request.cookies.get(self.get_cookie_name(app))
-        if cookie is None:
-            return self.session_class()
         max_age = int(app.permanent_session_lifetime.total_seconds())
-        try:
-            data = signer.loads(cookie, max_age=max_age)
+        if type(signer) is not URLSafeTimedSerializer:
+            # Serializers from overridden get_signing_serializer methods
+            # may not support unsigning with timestamps.
+            try:
+                data = signer.loads(cookie, max_age=max_age)
+            except BadSignature:
+                return self.session_class()
             return self.session_class(data)
+
+        try:
+            payload, signed_at = self._unsign_cookie(signer, cookie)
         except BadSignature:
             return self.session_class()
 
+        # The age is checked here, rather than by the signer, so that
+        # the cached verification is only valid whilst not expired.
+        age = int(time.time()) - signed_at
+        if age > max_age or age < 0:
+            return self.session_class()
+
+        try:
+            data = signer.load_payload(payload)
+        except BadSignature:
+            return self.session_class()
+        return self.session_class(data)
+
+    def _unsign_cookie(
+        self, signer: URLSafeTimedSerializer, cookie: str
+    ) -> tuple[bytes, int]:
+        # Verifying the HMAC is the expensive part of opening a session,
+        # and browsers present the same cookie on every request. Only
+        # successful verifications are cached, for the current signer
+        # only, and the payload is deserialised on each use so that
+        # sessions never share mutable values.
+        cached_signer, verified = self.__dict__.get("_verified_cookies", (None, {}))
+        if cached_signer is not signer:
+            verified = {}
+            self._verified_cookies = (signer, verified)
+        try:
+            # Reinsert on a hit so that eviction drops the least recently
+            # used cookie.
+            result = verified[cookie] = verified.pop(cookie)
+            return result
+        except KeyError:
+            pass
+
+        last_error: BadSignature | None = None
+        for unsigner in signer.iter_unsigners():
+            try:
+                payload, timestamp = unsigner.unsign(cookie, return_timestamp=True)
+            except BadSignature as error:
+                last_error = error
+            else:
+                if len(verified) >= _VERIFIED_COOKIES_MAX_SIZE:
+                    del verified[next(iter(verified))]
+                result = verified[cookie] = payload, int(timestamp.timestamp())
+                return result
+        raise last_error
+
     async def save_session(
         self,
         app: Quart,
@@ -202,6 +320,18 @@ class SecureCookieSessionInterface(SessionInterface):
                 )
             return
 
+        # Add a "Vary: Cookie" header if the session was accessed at all.
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        # If the session is empty and unmodified, or should not be
+        # refreshed, return without reading the cookie configuration.
+        if not session:
+            if not session.modified:
+                return
+        elif not self.should_set_cookie(app, session):
+            return
+
         name = self.get_cookie_name(app)
         domain = self.get_cookie_domain(app)
         partitioned = self.get_cookie_partitioned(app)
@@ -210,32 +340,22 @@ class SecureCookieSessionInterface(SessionInterface):
         samesite = self.get_cookie_samesite(app)
         httponly = self.get_cookie_httponly(app)
 
-        # Add a "Vary: Cookie" header if the session was accessed at all.
-        if session.accessed:
-            response.vary.add("Cookie")
-
         # If the session is modified to be empty, remove the cookie.
-        # If the session is empty, return without setting the cookie.
         if not session:
-            if session.modified:
-                response.delete_cookie(
-                    name,
-                    domain=domain,
-                    partitioned=partitioned,
-                    path=path,
-                    secure=secure,
-                    samesite=samesite,
-                    httponly=httponly,
-                )
-                response.vary.add("Cookie")
-
-            return
-
-        if not self.should_set_cookie(app, session):
+            response.delete_cookie(
+                name,
+                domain=domain,
+                partitioned=partitioned,
+                path=path,
+                secure=secure,
+                samesite=samesite,
+                httponly=httponly,
+            )
+            response.vary.add("Cookie")
             return
 
         expires = self.get_expiration_time(app, session)
-        val = self.get_signing_serializer(app).dumps(dict(session))
+        val = self.get_signing_serializer(app).dumps(session)
         response.set_cookie(
             name,
             val,
@@ -248,3 +368,129 @@ class SecureCookieSessionInterface(SessionInterface):
             samesite=samesite,
         )
         response.vary.add("Cookie")
+
+
+class MsgpackSigner:
+    """Signs and verifies session data packed with msgpack.
+
+    The signed value is the signing time as a 4 byte timestamp
+    followed by the packed data, with a truncated HMAC appended. The
+    whole is then url safe base64 encoded without padding.
+
+    Arguments:
+        secret_keys: The secret key to sign with followed by any keys
+            that are also accepted when verifying.
+        salt: Used to derive the keys from the secret keys.
+        digest_method: The hash function used for the HMAC.
+    """
+
+    mac_size = 16
+    timestamp = struct.Struct(">I")
+
+    def __init__(
+        self,
+        secret_keys: list[str | bytes],
+        salt: str | bytes,
+        digest_method: Callable[..., Any],
+    ) -> None:
+        self.digest_method = digest_method
+        self.keys = [
+            hmac.new(want_bytes(key), want_bytes(salt), digest_method).digest()
+            for key in secret_keys
+        ]
+
+    def _mac(self, key: bytes, value: bytes) -> bytes:
+        return hmac.new(key, value, self.digest_method).digest()[: self.mac_size]
+
+    def dumps(self, data: Any) -> str:
+        value = self.timestamp.pack(int(time.time())) + msgpack.packb(data)
+        signed = urlsafe_b64encode(value + self._mac(self.keys[0], value))
+        return signed.rstrip(b"=").decode("ascii")
+
+    def loads(self, signed: str, max_age: int) -> Any:
+        """Verify the signed value and return the unpacked data.
+
+        Raises:
+            BadSignature: If the value has been altered, was not
+                signed by any of the keys, or is older than max_age.
+        """
+        try:
+            value = urlsafe_b64decode(want_bytes(signed) + b"=" * (-len(signed) % 4))
+        except (binascii.Error, ValueError) as error:
+            raise BadSignature("Invalid encoding") from error
+
+        if len(value) < self.timestamp.size + self.mac_size:
+            raise BadSignature("Value too short")
+
+        value, mac = value[: -self.mac_size], value[-self.mac_size :]
+        if not any(
+            hmac.compare_digest(mac, self._mac(key, value)) for key in self.keys
+        ):
+            raise BadSignature("Signature does not match")
+
+        age = int(time.time()) - self.timestamp.unpack_from(value)[0]
+        if age > max_age or age < 0:
+            raise BadSignature("Signature expired")
+
+        try:
+            return msgpack.unpackb(value[self.timestamp.size :])
+        except ValueError as error:
+            raise BadSignature("Invalid payload") from error
+
+
+class FastSessionInterface(SecureCookieSessionInterface):
+    """A cookie session interface using msgpack and a raw HMAC.
+
+    This is an opt-in alternative to the
+    :class:`SecureCookieSessionInterface`, which avoids the tagged
+    JSON serializer and the itsdangerous signing format, and produces
+    smaller cookies. It requires the ``msgpack`` package, and session
+    values are limited to the types msgpack supports (tuples are
+    loaded as lists). Cookies are not compatible with the default
+    interface. To use it set,
+
+        app.session_interface = FastSessionInterface()
+    """
+
+    fallback_digest_methods = ()
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise RuntimeError(
+                "The FastSessionInterface requires msgpack,"
+                ' do "pip install msgpack" to use it.'
+            )
+        super().__init__()
+
+    def get_signing_serializer(self, app: Quart) -> MsgpackSigner | None:  # type: ignore[override]
+        if not app.secret_key:
+            return None
+
+        keys = (app.secret_key, *(app.config["SECRET_KEY_FALLBACKS"] or ()))
+        cached_keys, cached = self.__dict__.get("_signer", (None, None))
+        if cached_keys == keys:
+            return cached
+
+        signer = MsgpackSigner(list(keys), self.salt, self.digest_method)
+        self._signer = (keys, signer)
+        return signer
+
+    async def open_session(
+        self, app: Quart, request: BaseRequestWebsocket
+    ) -> SecureCookieSession | None:
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie is None:
+            if not app.secret_key:
+                return None
+            return self.session_class()
+
+        signer = self.get_signing_serializer(app)
+        if signer is None:
+            return None
+
+        max_age = int(app.permanent_session_lifetime.total_seconds())
+        try:
+            data = signer.loads(cookie, max_age)
+        except BadSignature:
+            return self.session_class()
+        return self.session_class(data)
@@ -53,9 +53,10 @@ async def render_template(
             possible template names.
         context: The variables to pass to the template.
     """
-    await current_app.update_template_context(context)
-    template = current_app.jinja_env.get_or_select_template(template_name_or_list)  # type: ignore
-    return await _render(template, context, current_app._get_current_object())  # type: ignore
+    app = current_app._get_current_object()  # type: ignore
+    await app.update_template_context(context)
+    template = app.jinja_env.get_or_select_template(template_name_or_list)
+    return await _render(template, context, app)
 
 
 async def render_template_string(source: str, **context: Any) -> str:
@@ -65,9 +66,10 @@ async def render_template_string(source: str, **context: Any) -> str:
         source: The template source code.
         context: The variables to pass to the template.
     """
-    await current_app.update_template_context(context)
-    template = current_app.jinja_env.from_string(source)
-    return await _render(template, context, current_app._get_current_object())  # type: ignore
+    app = current_app._get_current_object()  # type: ignore
+    await app.update_template_context(context)
+    template = app.jinja_env.from_string(source)
+    return await _render(template, context, app)
 
 
 async def _render(template: Template, context: dict, app: Quart) -> str:
@@ -110,9 +112,10 @@ async def stream_template(
             list is given, the first name to exist will be rendered.
         context: The variables to make available in the template.
     """
-    await current_app.update_template_context(context)
-    template = current_app.jinja_env.get_or_select_template(template_name_or_list)
-    return await _stream(current_app._get_current_object(), template, context)  # type: ignore
+    app = current_app._get_current_object()  # type: ignore
+    await app.update_template_context(context)
+    template = app.jinja_env.get_or_select_template(template_name_or_list)
+    return await _stream(app, template, context)
 
 
 async def stream_template_string(source: str, **context: Any) -> AsyncIterator[str]:
@@ -125,9 +128,10 @@ async def stream_template_string(source: str, **context: Any) -> AsyncIterator[s
         source: The source code of the template to render.
         context: The variables to make available in the template.
     """
-    await current_app.update_template_context(context)
-    template = current_app.jinja_env.from_string(source)
-    return await _stream(current_app._get_current_object(), template, context)  # type: ignore
+    app = current_app._get_current_object()  # type: ignore
+    await app.update_template_context(context)
+    template = app.jinja_env.from_string(source)
+    return await _stream(app, template, context)
 
 
 async def _stream(
@@ -4,6 +4,7 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from datetime import datetime
 from datetime import timedelta
+from http.cookiejar import Cookie
 from http.cookiejar import CookieJar
 from types import TracebackType
 from typing import Any
@@ -37,12 +38,7 @@ class _TestWrapper:
         self.headers = headers
 
     def get_all(self, name: str, default: Any | None = None) -> list[str]:
-        name = name.lower()
-        result = []
-        for key, value in self.headers:
-            if key.lower() == name:
-                result.append(value)
-        return result or default or []
+        return self.headers.getlist(name) or default or []
 
 
 class _TestCookieJarResponse:
@@ -53,6 +49,41 @@ class _TestCookieJarResponse:
         return _TestWrapper(self.headers)
 
 
+class _TestCookieJar(CookieJar):
+    """A cookie jar that caches the request cookie header value.
+
+    All changes to the jar go via either set_cookie or clear, which
+    therefore invalidate the cache.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._header_value: str | None = None
+
+    def set_cookie(self, cookie: Cookie) -> None:
+        super().set_cookie(cookie)
+        self._header_value = None
+
+    def clear(
+        self,
+        domain: str | None = None,
+        path: str | None = None,
+        name: str | None = None,
+    ) -> None:
+        super().clear(domain, path, name)
+        self._header_value = None
+
+    def header_value(self) -> str:
+        if self._header_value is None:
+            self._header_value = _cookie_header_value(self)
+        return self._header_value
+
+
+def _cookie_header_value(cookie_jar: CookieJar) -> str:
+    # Only the name=value pairs belong in a request's Cookie header.
+    return "; ".join(f"{cookie.name}={cookie.value}" for cookie in cookie_jar)
+
+
 class QuartClient:
     http_connection_class: type[TestHTTPConnectionProtocol]
     websocket_connection_class: type[TestWebsocketConnectionProtocol]
@@ -64,7 +95,7 @@ class QuartClient:
         self.app = app
         self.cookie_jar: CookieJar | None
         if use_cookies:
-            self.cookie_jar = CookieJar()
+            self.cookie_jar = _TestCookieJar()
         else:
             self.cookie_jar = None
         self.preserve_context = False
@@ -156,8 +187,7 @@ class QuartClient:
             subdomain,
         )
         if self.cookie_jar is not None:
-            for cookie in self.cookie_jar:
-                headers.add("cookie", f"{cookie.name}={cookie.value}")
+            self._add_cookie_header(headers)
         scope = make_test_scope(
             "http",
             path,
@@ -197,8 +227,7 @@ class QuartClient:
             subdomain,
         )
         if self.cookie_jar is not None:
-            for cookie in self.cookie_jar:
-                headers.add("cookie", f"{cookie.name}={cookie.value}")
+            self._add_cookie_header(headers)
         scope = make_test_scope(
             "websocket",
             path,
@@ -306,9 +335,8 @@ class QuartClient:
             httponly=httponly,
             samesite=samesite,
         )
-        self.cookie_jar.extract_cookies(
-            _TestCookieJarResponse(Headers([("set-cookie", cookie)])),  # type: ignore
-            U2Request(f"http://{server_name}{path}"),
+        self._extract_cookies(
+            Headers([("set-cookie", cookie)]), f"http://{server_name}{path}"
         )
 
     def delete_cookie(
@@ -342,12 +370,9 @@ class QuartClient:
 
         if headers is None:
             headers = Headers()
-        elif isinstance(headers, Headers):
-            headers = headers
-        elif headers is not None:
+        elif not isinstance(headers, Headers):
             headers = Headers(headers)
-        for cookie in self.cookie_jar:
-            headers.add("cookie", f"{cookie.name}={cookie.value}")
+        self._add_cookie_header(headers)
 
         original_request_ctx = _cv_request.get(None)
         async with self.app.test_request_context(
@@ -377,10 +402,7 @@ class QuartClient:
             response = self.app.response_class(b"")
             if not session_interface.is_null_session(session):
                 await session_interface.save_session(self.app, session, response)
-            self.cookie_jar.extract_cookies(
-                _TestCookieJarResponse(response.headers),  # type: ignore
-                U2Request(ctx.request.url),
-            )
+            self._extract_cookies(response.headers, ctx.request.url)
 
     async def __aenter__(self) -> QuartClient:
         if self.preserve_context:
@@ -401,6 +423,24 @@ class QuartClient:
             else:
                 break
 
+    def _add_cookie_header(self, headers: Headers) -> None:
+        if isinstance(self.cookie_jar, _TestCookieJar):
+            value = self.cookie_jar.header_value()
+        else:
+            value = _cookie_header_value(self.cookie_jar)
+        if value:
+            headers.add("cookie", value)
+
+    def _extract_cookies(self, headers: Headers, url: str) -> None:
+        # Most responses don't set cookies, so skip the cookiejar's
+        # parsing and policy machinery unless there is something to do.
+        if "set-cookie" not in headers:
+            return
+        self.cookie_jar.extract_cookies(
+            _TestCookieJarResponse(headers),  # type: ignore
+            U2Request(url),
+        )
+
     async def _make_request(
         self,
         path: str,
@@ -421,14 +461,16 @@ class QuartClient:
         headers, path, query_string_bytes = make_test_headers_path_and_query_string(
             self.app, path, headers, query_string, auth, subdomain
         )
-        request_data, body_headers = make_test_body_with_headers(
-            data=data, form=form, files=files, json=json, app=self.app
-        )
-        headers.update(**body_headers)
+        if data is None and form is None and files is None and json is sentinel:
+            request_data = b""
+        else:
+            request_data, body_headers = make_test_body_with_headers(
+                data=data, form=form, files=files, json=json, app=self.app
+            )
+            headers.update(**body_headers)
 
         if self.cookie_jar is not None:
-            for cookie in self.cookie_jar:
-                headers.add("cookie", f"{cookie.name}={cookie.value}")
+            self._add_cookie_header(headers)
 
         scope = make_test_scope(
             "http",
@@ -449,9 +491,8 @@ class QuartClient:
             await connection.send_complete()
         response = await connection.as_response()
         if self.cookie_jar is not None:
-            self.cookie_jar.extract_cookies(
-                _TestCookieJarResponse(response.headers),  # type: ignore
-                U2Request(f"{scheme}://{headers['host']}{path}"),
+            self._extract_cookies(
+                response.headers, f"{scheme}://{headers['host']}{path}"
             )
         self.push_promises.extend(connection.push_promises)
         return response
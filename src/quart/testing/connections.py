@@ -62,6 +62,7 @@ class TestHTTPConnection:
         )
 
     async def receive(self) -> bytes:
+        self._start()
         data = await self._receive_queue.get()
         if isinstance(data, Exception):
             raise data
@@ -72,9 +73,6 @@ class TestHTTPConnection:
         await self._send_queue.put({"type": "http.disconnect"})
 
     async def __aenter__(self) -> TestHTTPConnection:
-        self._task = asyncio.ensure_future(
-            self.app(self.scope, self._asgi_receive, self._asgi_send)
-        )
         return self
 
     async def __aexit__(
@@ -82,7 +80,12 @@ class TestHTTPConnection:
     ) -> None:
         if exc_type is not None:
             await self.disconnect()
-        await self._task
+        if self._task is None:
+            # Nothing has waited on the app, so the request is complete
+            # and the app can be run directly without a task.
+            await self.app(self.scope, self._asgi_receive, self._asgi_send)
+        else:
+            await self._task
         while not self._receive_queue.empty():
             data = await self._receive_queue.get()
             if isinstance(data, bytes):
@@ -99,6 +102,12 @@ class TestHTTPConnection:
             bytes(self.response_data), self.status_code, self.headers
         )
 
+    def _start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(
+                self.app(self.scope, self._asgi_receive, self._asgi_send)
+            )
+
     async def _asgi_receive(self) -> ASGIReceiveEvent:
         return await self._send_queue.get()
 
@@ -155,9 +164,9 @@ class TestWebsocketConnection:
 
     async def send(self, data: AnyStr) -> None:
         if isinstance(data, str):
-            await self._send_queue.put({"type": "websocket.receive", "text": data})
+            self._send_queue.put_nowait({"type": "websocket.receive", "text": data})
         else:
-            await self._send_queue.put({"type": "websocket.receive", "bytes": data})
+            self._send_queue.put_nowait({"type": "websocket.receive", "bytes": data})
 
     async def receive_json(self) -> Any:
         data = await self.receive()
@@ -168,10 +177,10 @@ class TestWebsocketConnection:
         await self.send(raw)
 
     async def close(self, code: int) -> None:
-        await self._send_queue.put({"type": "websocket.close", "code": code})
+        self._send_queue.put_nowait({"type": "websocket.close", "code": code})
 
     async def disconnect(self) -> None:
-        await self._send_queue.put({"type": "websocket.disconnect"})
+        self._send_queue.put_nowait({"type": "websocket.disconnect"})
 
     async def _asgi_receive(self) -> ASGIReceiveEvent:
         return await self._send_queue.get()
@@ -180,14 +189,14 @@ class TestWebsocketConnection:
         if message["type"] == "websocket.accept":
             self.accepted = True
         elif message["type"] == "websocket.send":
-            await self._receive_queue.put(message.get("bytes") or message.get("text"))
+            self._receive_queue.put_nowait(message.get("bytes") or message.get("text"))
         elif message["type"] == "websocket.http.response.start":
             self.headers = decode_headers(message["headers"])
             self.status_code = message["status"]
         elif message["type"] == "websocket.http.response.body":
             self.response_data.extend(message["body"])
             if not message.get("more_body", False):
-                await self._receive_queue.put(
+                self._receive_queue.put_nowait(
                     WebsocketResponseError(
                         self.app.response_class(
                             bytes(self.response_data), self.status_code, self.headers
@@ -195,6 +204,6 @@ class TestWebsocketConnection:
                     )
                 )
         elif message["type"] == "websocket.close":
-            await self._receive_queue.put(
+            self._receive_queue.put_nowait(
                 WebsocketDisconnectError(message.get("code", 1000))
             )
@@ -51,31 +51,36 @@ def make_test_headers_path_and_query_string(
         query_string: To send as a dictionary, alternatively the
             query_string can be determined from the path.
     """
-    if headers is None:
-        headers = Headers()
-    elif isinstance(headers, Headers):
-        headers = headers
-    elif headers is not None:
-        headers = Headers(headers)
-
-    if auth is not None:
-        if isinstance(auth, tuple):
-            auth = Authorization("basic", {"username": auth[0], "password": auth[1]})
-        headers.setdefault("Authorization", auth.to_header())
-
-    headers.setdefault("User-Agent", "Quart")
+    if isinstance(auth, tuple):
+        auth = Authorization("basic", {"username": auth[0], "password": auth[1]})
     host = app.config["SERVER_NAME"] or "localhost"
     if subdomain is not None:
         host = f"{subdomain}.{host}"
-    headers.setdefault("host", host)
-    if "?" in path and query_string is not None:
+
+    default_headers = [("User-Agent", "Quart"), ("host", host)]
+    if auth is not None:
+        default_headers.insert(0, ("Authorization", auth.to_header()))
+    if headers is None:
+        # Nothing to check against, so build the defaults in one go.
+        headers = Headers(default_headers)
+    else:
+        # Always copy, as the defaults, body and cookie headers are added
+        # to the result and must not leak into the caller's headers.
+        headers = Headers(headers)
+        headers.extend([item for item in default_headers if item[0] not in headers])
+    path_has_query = "?" in path
+    if path_has_query and query_string is not None:
         raise ValueError("Query string is defined in the path and as an argument")
-    if query_string is None:
+    if query_string:
+        query_string_bytes = urlencode(query_string, doseq=True).encode("ascii")
+    elif path_has_query:
         path, _, query_string_raw = path.partition("?")
+        query_string_bytes = query_string_raw.encode("ascii")
     else:
-        query_string_raw = urlencode(query_string, doseq=True)
-    query_string_bytes = query_string_raw.encode("ascii")
-    return headers, unquote(path), query_string_bytes
+        query_string_bytes = b""
+    if "%" in path:
+        path = unquote(path)
+    return headers, path, query_string_bytes
 
 
 def make_test_body_with_headers(
@@ -97,11 +102,11 @@ def make_test_body_with_headers(
         json: Data to send json encoded in the request body.
 
     """
-    if [json is not sentinel, form is not None, data is not None].count(True) > 1:
+    if (json is not sentinel) + (form is not None) + (data is not None) > 1:
         raise ValueError(
             "Quart test args 'json', 'form', and 'data' are mutually exclusive"
         )
-    if [json is not sentinel, files is not None, data is not None].count(True) > 1:
+    if (json is not sentinel) + (files is not None) + (data is not None) > 1:
         raise ValueError(
             "Quart test args 'files', 'json', and 'data' are mutually exclusive"
         )
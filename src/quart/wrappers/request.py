@@ -52,6 +52,7 @@ class Body:
         self, expected_content_length: int | None, max_content_length: int | None
     ) -> None:
         self._data = bytearray()
+        self._result: bytes | None = None
         self._complete: asyncio.Event = asyncio.Event()
         self._has_data: asyncio.Event = asyncio.Event()
         self._max_content_length = max_content_length
@@ -84,6 +85,7 @@ class Body:
 
         data = bytes(self._data)
         self._data.clear()
+        self._result = None
         self._has_data.clear()
         return data
 
@@ -98,7 +100,12 @@ class Body:
 
         if self._must_raise is not None:
             raise self._must_raise
-        return bytes(self._data)
+        if self._result is None:
+            # Copy once, so that awaiting the body again (e.g. form
+            # then JSON) doesn't copy it again. The buffer is kept as
+            # iterating (e.g. multipart form parsing) consumes it.
+            self._result = bytes(self._data)
+        return self._result
 
     def append(self, data: bytes) -> None:
         if data == b"" or self._must_raise is not None:
@@ -123,6 +130,7 @@ class Body:
 
     def clear(self) -> None:
         self._data.clear()
+        self._result = None
 
 
 class Request(BaseRequestWebsocket):
@@ -373,7 +381,9 @@ class Request(BaseRequestWebsocket):
         if not (force or self.is_json):
             return None
 
-        data = await self.get_data(cache=cache, as_text=True)
+        # JSON providers accept bytes, which lets them skip a separate
+        # decoding pass and detect the encoding themselves.
+        data = await self.get_data(cache=cache)
 
         try:
             result = self.json_module.loads(data)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC
 from abc import abstractmethod
 from collections.abc import AsyncGenerator
@@ -11,13 +12,11 @@ from io import BytesIO
 from os import PathLike
 from types import TracebackType
 from typing import Any
+from typing import BinaryIO
 from typing import Literal
 from typing import overload
 from typing import TYPE_CHECKING
 
-from aiofiles import open as async_open
-from aiofiles.base import AiofilesContextManager
-from aiofiles.threadpool.binary import AsyncBufferedIOBase
 from werkzeug.datastructures import ContentRange
 from werkzeug.datastructures import Headers
 from werkzeug.exceptions import RequestedRangeNotSatisfiable
@@ -100,10 +99,25 @@ class _DataBodyGen(AsyncIterator[bytes]):
         return self._data_body.data[self._data_body.begin : self._data_body.end]
 
 
+class _SequenceBodyGen(AsyncIterator[Any]):
+    def __init__(self, sequence: list[Any] | tuple[Any, ...]) -> None:
+        self._iter = iter(sequence)
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
 class IterableBody(ResponseBody):
     def __init__(self, iterable: AsyncIterable[Any] | Iterable[Any]) -> None:
         self.iter: AsyncIterator[Any]
-        if isinstance(iterable, Iterable):
+        if isinstance(iterable, (list, tuple)):
+            # Iterating a sequence cannot block, so there is no need to
+            # step it in the executor.
+            self.iter = _SequenceBodyGen(iterable)
+        elif isinstance(iterable, Iterable):
             self.iter = run_sync_iterable(iter(iterable))
         else:
             self.iter = iterable.__aiter__()  # Can't use aiter() until 3.10
@@ -129,46 +143,63 @@ class FileBody(ResponseBody):
     allows a range to be set on the file, thereby supporting
     conditional requests.
 
+    Arguments:
+        file_path: The path of the file to send.
+        size: The size of the file, if already known, to save a stat
+            call.
+
     Attributes:
         buffer_size: Size in bytes to load per iteration.
     """
 
-    buffer_size = 8192
+    buffer_size = 65536
 
     def __init__(
-        self, file_path: str | PathLike, *, buffer_size: int | None = None
+        self,
+        file_path: str | PathLike,
+        *,
+        buffer_size: int | None = None,
+        size: int | None = None,
     ) -> None:
         self.file_path = file_path_to_path(file_path)
-        self.size = self.file_path.stat().st_size
+        self.size = self.file_path.stat().st_size if size is None else size
         self.begin = 0
         self.end = self.size
         if buffer_size is not None:
             self.buffer_size = buffer_size
-        self.file: AsyncBufferedIOBase | None = None
-        self.file_manager: AiofilesContextManager = None
+        self.position = 0
+        self.file: BinaryIO | None = None
+
+    def _open(self) -> BinaryIO:
+        file_ = open(self.file_path, "rb")
+        file_.seek(self.begin)
+        return file_
 
     async def __aenter__(self) -> FileBody:
-        self.file_manager = async_open(self.file_path, mode="rb")
-        self.file = await self.file_manager.__aenter__()
-        await self.file.seek(self.begin)
+        # Each file operation blocks, hence runs in a worker thread,
+        # with opening and seeking combined into a single round trip.
+        self.file = await asyncio.to_thread(self._open)
+        self.position = self.begin
         return self
 
     async def __aexit__(
         self, exc_type: type, exc_value: BaseException, tb: TracebackType
     ) -> None:
-        await self.file_manager.__aexit__(exc_type, exc_value, tb)
+        await asyncio.to_thread(self.file.close)
 
     def __aiter__(self) -> FileBody:
         return self
 
     async def __anext__(self) -> bytes:
-        current = await self.file.tell()
-        if current >= self.end:
+        # The position is tracked here as each call on the file is a
+        # round trip to a worker thread.
+        if self.position >= self.end:
             raise StopAsyncIteration()
-        read_size = min(self.buffer_size, self.end - current)
-        chunk = await self.file.read(read_size)
+        read_size = min(self.buffer_size, self.end - self.position)
+        chunk = await asyncio.to_thread(self.file.read, read_size)
 
         if chunk:
+            self.position += len(chunk)
             return chunk
         else:
             raise StopAsyncIteration()
@@ -319,16 +350,17 @@ class Response(SansIOResponse):
 
     async def get_data(self, as_text: bool = False) -> str | bytes:
         """Return the body data."""
-        if self.implicit_sequence_conversion:
+        if self.implicit_sequence_conversion and not isinstance(
+            self.response, DataBody
+        ):
             await self.make_sequence()
-        result = "" if as_text else b""
+        chunks = []
         async with self.response as body:
             async for data in body:
-                if as_text:
-                    result += data.decode()
-                else:
-                    result += data
-        return result
+                chunks.append(data)
+        result = b"".join(chunks)
+        # Decode once so that characters split across chunks survive.
+        return result.decode() if as_text else result
 
     def set_data(self, data: str | bytes) -> None:
         """Set the response data.
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 
@@ -17,6 +19,8 @@ from quart.asgi import _handle_exception
 from quart.asgi import ASGIHTTPConnection
 from quart.asgi import ASGIWebsocketConnection
 from quart.utils import encode_headers
+from quart.wrappers import Response
+from quart.wrappers.response import FileBody
 
 
 @pytest.mark.parametrize(
@@ -302,6 +306,103 @@ async def test_websocket_accept_connection_warns(
         await connection.accept_connection(mock_send, Headers({"a": "b"}), None)
 
 
+@pytest.mark.parametrize(
+    "extensions, zerocopy",
+    [({"http.response.zerocopysend": {}}, True), ({}, False)],
+)
+async def test_http_send_file_zerocopy(
+    extensions: dict, zerocopy: bool, tmp_path: Path
+) -> None:
+    file_ = tmp_path / "send.img"
+    file_.write_bytes(b"something")
+    connection = ASGIHTTPConnection(
+        Quart(__name__),
+        {"extensions": extensions},  # type: ignore
+    )
+    file_body = FileBody(file_)
+    await file_body.make_conditional(2, 6)
+    messages: list = []
+
+    async def send(message: Any) -> None:
+        if message["type"] == "http.response.zerocopysend":
+            assert message["file"].fileno() >= 0
+        messages.append(message)
+
+    await connection._send_response(send, Response(file_body))
+    if zerocopy:
+        assert [message["type"] for message in messages] == [
+            "http.response.start",
+            "http.response.zerocopysend",
+        ]
+        assert messages[1]["offset"] == 2
+        assert messages[1]["count"] == 4
+        assert messages[1]["file"].closed
+    else:
+        body = b"".join(message.get("body", b"") for message in messages)
+        assert body == b"meth"
+
+
+@pytest.mark.parametrize(
+    "extensions, begin, expected",
+    [
+        ({"http.response.pathsend": {}}, 0, "http.response.pathsend"),
+        ({"http.response.pathsend": {}}, 2, "http.response.body"),
+        (
+            {"http.response.pathsend": {}, "http.response.zerocopysend": {}},
+            2,
+            "http.response.zerocopysend",
+        ),
+    ],
+)
+async def test_http_send_file_pathsend(
+    extensions: dict, begin: int, expected: str, tmp_path: Path
+) -> None:
+    file_ = tmp_path / "send.img"
+    file_.write_bytes(b"something")
+    connection = ASGIHTTPConnection(
+        Quart(__name__),
+        {"extensions": extensions},  # type: ignore
+    )
+    file_body = FileBody(file_)
+    await file_body.make_conditional(begin, None)
+    messages: list = []
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    await connection._send_response(send, Response(file_body))
+    assert messages[1]["type"] == expected
+    if expected == "http.response.pathsend":
+        assert messages[1]["path"] == str(file_)
+        assert len(messages) == 2
+
+
+async def test_http_send_file_subclass(tmp_path: Path) -> None:
+    class UpperFileBody(FileBody):
+        async def __anext__(self) -> bytes:
+            return (await super().__anext__()).upper()
+
+    file_ = tmp_path / "send.img"
+    file_.write_bytes(b"something")
+    connection = ASGIHTTPConnection(
+        Quart(__name__),
+        {  # type: ignore
+            "extensions": {
+                "http.response.pathsend": {},
+                "http.response.zerocopysend": {},
+            }
+        },
+    )
+    messages: list = []
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    await connection._send_response(send, Response(UpperFileBody(file_)))
+    body = b"".join(message.get("body", b"") for message in messages)
+    assert body == b"SOMETHING"
+
+
 def test__convert_version() -> None:
     assert _convert_version("2.1") == [2, 1]
 
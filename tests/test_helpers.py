@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from collections.abc import AsyncGenerator
 from datetime import datetime
 from datetime import timezone
@@ -12,6 +13,8 @@ from werkzeug.exceptions import NotFound
 from quart import Blueprint
 from quart import Quart
 from quart import request
+from quart import Response
+from quart.helpers import _file_cache
 from quart.helpers import flash
 from quart.helpers import get_flashed_messages
 from quart.helpers import make_response
@@ -19,6 +22,8 @@ from quart.helpers import send_file
 from quart.helpers import send_from_directory
 from quart.helpers import stream_with_context
 from quart.helpers import url_for
+from quart.wrappers.response import DataBody
+from quart.wrappers.response import FileBody
 
 SERVER_NAME = "localhost"
 
@@ -184,9 +189,19 @@ async def test_stream_with_context() -> None:
     assert result == b"GET /"
 
 
-async def test_send_from_directory_raises() -> None:
+@pytest.mark.parametrize("file_name", ["no_file.no", "assets", "bad\x00name"])
+async def test_send_from_directory_raises(file_name: str) -> None:
     with pytest.raises(NotFound):
-        await send_from_directory(str(ROOT_PATH), "no_file.no")
+        await send_from_directory(str(ROOT_PATH), file_name)
+
+
+async def test_send_from_directory_bytes_directory(tmp_path: Path) -> None:
+    app = Quart(__name__)
+    file_ = tmp_path / "send.img"
+    file_.write_text("something")
+    async with app.test_request_context("/"):
+        response = await send_from_directory(bytes(tmp_path), "send.img")
+    assert (await response.get_data(as_text=False)) == file_.read_bytes()
 
 
 async def test_send_file_path(tmp_path: Path) -> None:
@@ -243,6 +258,110 @@ async def test_send_file_mimetype(tmp_path: Path) -> None:
     assert response.headers["Content-Type"] == "application/bob"
 
 
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("send.css", "text/css; charset=utf-8"),
+        ("send.CSS", "text/css; charset=utf-8"),
+        ("send.tar.gz", "application/x-tar"),
+        ("send.bob", "application/octet-stream"),
+    ],
+)
+async def test_send_file_guessed_mimetype(
+    filename: str, expected: str, tmp_path: Path
+) -> None:
+    app = Quart(__name__)
+    file_ = tmp_path / filename
+    file_.write_text("something")
+    async with app.app_context():
+        response = await send_file(Path(file_))
+    assert response.headers["Content-Type"] == expected
+
+
+async def test_send_file_etag(tmp_path: Path) -> None:
+    app = Quart(__name__)
+    file_ = tmp_path / "send.img"
+    file_.write_text("something")
+    async with app.app_context():
+        etag, _ = (await send_file(str(file_))).get_etag()
+        assert etag == (await send_file(str(file_))).get_etag()[0]
+        os.utime(file_, (0, 0))
+        assert etag != (await send_file(str(file_))).get_etag()[0]
+
+
+async def test_send_file_cache(tmp_path: Path) -> None:
+    app = Quart(__name__)
+    app.config["SEND_FILE_CACHE_SIZE"] = 10
+    file_ = tmp_path / "send.img"
+    file_.write_text("something")
+    async with app.app_context():
+        response = await send_file(str(file_))
+        assert isinstance(response.response, DataBody)
+        assert (await response.get_data(as_text=False)) == b"something"
+        file_.write_text("different")
+        os.utime(file_, (0, 0))
+        response = await send_file(str(file_))
+        assert (await response.get_data(as_text=False)) == b"different"
+    assert _file_cache.size <= 10
+
+
+async def test_send_file_cache_larger_than_budget(tmp_path: Path) -> None:
+    app = Quart(__name__)
+    app.config["SEND_FILE_CACHE_SIZE"] = 1000
+    small = tmp_path / "small.img"
+    small.write_bytes(b"a" * 100)
+    large = tmp_path / "large.img"
+    large.write_bytes(b"b" * 5000)
+    _file_cache.clear()
+    async with app.app_context():
+        response = await send_file(str(small))
+        assert isinstance(response.response, DataBody)
+        response = await send_file(str(large))
+        assert isinstance(response.response, FileBody)
+    assert _file_cache.size == 100
+
+
+async def test_send_file_cache_body_subclass(tmp_path: Path) -> None:
+    class AuditedFileBody(FileBody):
+        pass
+
+    class AuditedResponse(Response):
+        file_body_class = AuditedFileBody
+
+    app = Quart(__name__)
+    app.config["SEND_FILE_CACHE_SIZE"] = 1000
+    app.response_class = AuditedResponse
+    file_ = tmp_path / "send.img"
+    file_.write_text("something")
+    _file_cache.clear()
+    async with app.app_context():
+        response = await send_file(str(file_))
+    assert isinstance(response.response, AuditedFileBody)
+    assert _file_cache.size == 0
+
+
+async def test_send_file_cache_conditional(tmp_path: Path) -> None:
+    app = Quart(__name__)
+    app.config["SEND_FILE_CACHE_SIZE"] = 1024
+    file_ = tmp_path / "conditional.img"
+    file_.write_text("something")
+    async with app.app_context():
+        etag, _ = (await send_file(str(file_))).get_etag()
+    _file_cache.clear()
+
+    headers = {"If-None-Match": f'"{etag}"'}
+    async with app.test_request_context("/", headers=headers):
+        response = await send_file(str(file_), conditional=True)
+    assert response.status_code == 304
+    assert _file_cache.size == 0
+
+    async with app.test_request_context("/", headers={"Range": "bytes=2-5"}):
+        response = await send_file(str(file_), conditional=True)
+    assert response.status_code == 206
+    assert (await response.get_data(as_text=False)) == b"meth"
+    assert _file_cache.size == 9
+
+
 async def test_send_file_last_modified(tmp_path: Path) -> None:
     app = Quart(__name__)
     file_ = tmp_path / "send.img"
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+from datetime import datetime
+from datetime import timezone
 from http.cookies import SimpleCookie
+from typing import Any
 
+import pytest
+from flask.json.tag import TaggedJSONSerializer as FlaskSerializer
 from hypercorn.typing import HTTPScope
+from itsdangerous import URLSafeSerializer
+from markupsafe import Markup
 from werkzeug.datastructures import Headers
 
 from quart.app import Quart
+from quart.json.tag import JSONTag
+from quart.json.tag import TaggedJSONSerializer
+from quart.sessions import FastSessionInterface
 from quart.sessions import SecureCookieSession
 from quart.sessions import SecureCookieSessionInterface
+from quart.sessions import session_json_serializer
 from quart.testing import no_op_push
 from quart.wrappers import Request
 from quart.wrappers import Response
@@ -39,6 +51,28 @@ async def test_secure_cookie_session_interface_open_session(
     assert new_session == session
 
 
+@pytest.mark.parametrize("secret_key, expected", [("secret", {}), (None, None)])
+async def test_secure_cookie_session_interface_open_session_no_cookie(
+    secret_key: str | None, expected: dict | None, http_scope: HTTPScope
+) -> None:
+    interface = SecureCookieSessionInterface()
+    app = Quart(__name__)
+    app.secret_key = secret_key
+    request = Request(
+        "GET",
+        "http",
+        "/",
+        b"",
+        Headers(),
+        "",
+        "1.1",
+        http_scope,
+        send_push_promise=no_op_push,
+    )
+    assert await interface.open_session(app, request) == expected
+    assert "_signing_serializer" not in interface.__dict__
+
+
 async def test_secure_cookie_session_interface_save_session() -> None:
     session = SecureCookieSession()
     session["something"] = "else"
@@ -84,3 +118,251 @@ async def test_secure_cookie_session_interface_save_session_no_access() -> None:
     response = await _save_session(session)
     assert response.headers.get("Set-Cookie") is None
     assert response.headers.get("Vary") is None
+
+
+def test_secure_cookie_session_interface_signing_serializer_cached() -> None:
+    interface = SecureCookieSessionInterface()
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    serializer = interface.get_signing_serializer(app)
+    assert interface.get_signing_serializer(app) is serializer
+    app.secret_key = "other"
+    other = interface.get_signing_serializer(app)
+    assert other is not serializer
+    assert interface._signing_serializer == (("other",), other)
+
+
+def test_secure_cookie_session_interface_verified_cookies_lru(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("quart.sessions._VERIFIED_COOKIES_MAX_SIZE", 2)
+    interface = SecureCookieSessionInterface()
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    signer = interface.get_signing_serializer(app)
+    first, second, third = (signer.dumps({"value": value}) for value in range(3))
+    interface._unsign_cookie(signer, first)
+    interface._unsign_cookie(signer, second)
+    interface._unsign_cookie(signer, first)
+    interface._unsign_cookie(signer, third)
+    _, verified = interface._verified_cookies
+    assert list(verified) == [first, third]
+
+
+async def test_secure_cookie_session_interface_custom_serializer(
+    http_scope: HTTPScope,
+) -> None:
+    class Interface(SecureCookieSessionInterface):
+        def get_signing_serializer(self, app: Quart) -> URLSafeSerializer:  # type: ignore[override]
+            return URLSafeSerializer(app.secret_key, salt=self.salt)
+
+    session = SecureCookieSession()
+    session["something"] = "else"
+    interface = Interface()
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    response = Response("")
+    await interface.save_session(app, session, response)
+    request = Request(
+        "GET",
+        "http",
+        "/",
+        b"",
+        Headers(),
+        "",
+        "1.1",
+        http_scope,
+        send_push_promise=no_op_push,
+    )
+    request.headers["Cookie"] = response.headers["Set-Cookie"]
+    assert await interface.open_session(app, request) == session
+
+
+def test_secure_cookie_session_interface_subclass_init() -> None:
+    class Interface(SecureCookieSessionInterface):
+        def __init__(self) -> None:
+            self.custom = True
+
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    interface = Interface()
+    serializer = interface.get_signing_serializer(app)
+    assert serializer is not None
+    assert interface.get_signing_serializer(app) is serializer
+
+
+async def test_secure_cookie_session_interface_open_session_expired(
+    http_scope: HTTPScope,
+) -> None:
+    session = SecureCookieSession()
+    session["something"] = "else"
+    interface = SecureCookieSessionInterface()
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    response = Response("")
+    await interface.save_session(app, session, response)
+    request = Request(
+        "GET",
+        "http",
+        "/",
+        b"",
+        Headers(),
+        "",
+        "1.1",
+        http_scope,
+        send_push_promise=no_op_push,
+    )
+    request.headers["Cookie"] = response.headers["Set-Cookie"]
+    assert await interface.open_session(app, request) == session
+    app.permanent_session_lifetime = -1
+    assert await interface.open_session(app, request) == SecureCookieSession()
+
+
+def test_session_json_serializer_round_trip() -> None:
+    value = {
+        "bytes": b"\x00\xff",
+        "datetime": datetime(2015, 10, 21, 7, 28, tzinfo=timezone.utc),
+        "tuple": (1, 2),
+        "nested": [{"bytes": b"a"}],
+    }
+    assert session_json_serializer.loads(session_json_serializer.dumps(value)) == value
+
+
+def test_session_json_serializer_tag_matches_flask() -> None:
+    value = {
+        "str": "value",
+        "markup": Markup("<b>"),
+        " t": [1, 2],
+        "nested": {" t": ("a", None, 1.5, True)},
+    }
+    assert session_json_serializer.dumps(value) == FlaskSerializer().dumps(value)
+
+
+class _TagUpper(JSONTag):
+    key = " up"
+
+    def check(self, value: Any) -> bool:
+        return isinstance(value, str) and value.isupper()
+
+    def to_json(self, value: Any) -> Any:
+        return value.lower()
+
+    def to_python(self, value: Any) -> Any:
+        return value.upper()
+
+
+def test_session_json_serializer_register() -> None:
+    serializer = TaggedJSONSerializer()
+    serializer.register(_TagUpper, index=0)
+    assert serializer.dumps(["ABC", "abc"]) == '[{" up":"abc"},"abc"]'
+    assert serializer.loads(serializer.dumps(["ABC", "abc"])) == ["ABC", "abc"]
+
+
+def test_session_json_serializer_default_tags() -> None:
+    class Serializer(TaggedJSONSerializer):
+        default_tags = [_TagUpper, *TaggedJSONSerializer.default_tags]
+
+    serializer = Serializer()
+    assert serializer.dumps(["ABC", "abc"]) == '[{" up":"abc"},"abc"]'
+    assert serializer.loads(serializer.dumps(["ABC", "abc"])) == ["ABC", "abc"]
+
+
+def test_secure_cookie_session_modified() -> None:
+    session = SecureCookieSession({"something": "else"})
+    assert not session.modified
+    session["other"] = "value"
+    assert session.modified
+    session.modified = False
+    del session["other"]
+    assert session.modified
+    session.modified = False
+    with pytest.raises(KeyError):
+        del session["other"]
+    assert not session.modified
+
+
+async def test_secure_cookie_session_interface_open_session_sha1(
+    http_scope: HTTPScope,
+) -> None:
+    session = SecureCookieSession()
+    session["something"] = "else"
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    response = Response("")
+    sha1_interface = SecureCookieSessionInterface()
+    sha1_interface.digest_method = staticmethod(hashlib.sha1)
+    await sha1_interface.save_session(app, session, response)
+    request = Request(
+        "GET",
+        "http",
+        "/",
+        b"",
+        Headers(),
+        "",
+        "1.1",
+        http_scope,
+        send_push_promise=no_op_push,
+    )
+    request.headers["Cookie"] = response.headers["Set-Cookie"]
+    interface = SecureCookieSessionInterface()
+    assert await interface.open_session(app, request) == session
+    strict_interface = SecureCookieSessionInterface()
+    strict_interface.fallback_digest_methods = ()
+    assert await strict_interface.open_session(app, request) == SecureCookieSession()
+
+
+async def test_fast_session_interface(http_scope: HTTPScope) -> None:
+    pytest.importorskip("msgpack")
+    session = SecureCookieSession({"ids": (1, 2), "raw": b"\x00"})
+    session["user"] = "bob"
+    interface = FastSessionInterface()
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    response = Response("")
+    await interface.save_session(app, session, response)
+    cookie = SimpleCookie(response.headers["Set-Cookie"])["session"].value
+
+    async def _open(cookie: str) -> SecureCookieSession | None:
+        request = Request(
+            "GET",
+            "http",
+            "/",
+            b"",
+            Headers({"Cookie": f"session={cookie}"}),
+            "",
+            "1.1",
+            http_scope,
+            send_push_promise=no_op_push,
+        )
+        return await interface.open_session(app, request)
+
+    assert await _open(cookie) == {"user": "bob", "ids": [1, 2], "raw": b"\x00"}
+    tampered = cookie[:-2] + ("AA" if cookie[-2:] != "AA" else "BB")
+    assert await _open(tampered) == SecureCookieSession()
+    assert await _open("!") == SecureCookieSession()
+
+    app.secret_key = "new secret"
+    app.config["SECRET_KEY_FALLBACKS"] = ["secret"]
+    assert await _open(cookie) == {"user": "bob", "ids": [1, 2], "raw": b"\x00"}
+
+    app.permanent_session_lifetime = -1
+    assert await _open(cookie) == SecureCookieSession()
+
+
+def test_fast_session_interface_signer_cached() -> None:
+    pytest.importorskip("msgpack")
+
+    class Interface(FastSessionInterface):
+        def __init__(self) -> None:
+            self.custom = True
+
+    interface = Interface()
+    app = Quart(__name__)
+    app.secret_key = "secret"
+    signer = interface.get_signing_serializer(app)
+    assert signer is not None
+    assert interface.get_signing_serializer(app) is signer
+    app.secret_key = "other"
+    other = interface.get_signing_serializer(app)
+    assert other is not signer
+    assert interface._signer == (("other",), other)
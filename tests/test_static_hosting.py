@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from quart.app import Quart
@@ -31,3 +32,28 @@ async def test_host_matching() -> None:
     assert response.status_code == 200
     data = await response.get_data(as_text=False)
     assert data == expected_data
+
+
+def test_static_folder() -> None:
+    app = Quart(__name__, static_folder="./assets/")
+    assert app.static_folder == os.path.join(app.root_path, "./assets")
+    app.static_folder = Path("other")
+    assert app.static_folder == os.path.join(app.root_path, "other")
+    app.root_path = "/srv"
+    assert app.static_folder == os.path.join("/srv", "other")
+    app.static_folder = None
+    assert app.static_folder is None
+    assert not app.has_static_folder
+
+
+async def test_static_immutable() -> None:
+    app = Quart(__name__, static_folder="./assets", static_url_path="/static")
+    app.config["STATIC_IMMUTABLE"] = True
+
+    test_client = app.test_client()
+
+    response = await test_client.get("/static/config.cfg")
+    assert response.status_code == 200
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age == 365 * 24 * 60 * 60
+    assert "ETag" not in response.headers
@@ -51,6 +51,7 @@ async def test_methods() -> None:
     [
         ("/path", {"a": "b"}, None, "/path", b"a=b", "localhost"),
         ("/path", {"a": ["b", "c"]}, None, "/path", b"a=b&a=c", "localhost"),
+        ("/path", {}, None, "/path", b"", "localhost"),
         ("/path?b=c", None, None, "/path", b"b=c", "localhost"),
         ("/path%20", None, None, "/path ", b"", "localhost"),
         ("/path", None, "api", "/path", b"", "api.localhost"),
@@ -200,6 +201,38 @@ def test_build_headers_path_and_query_string_headers_defaults(
     assert query_string == b""
 
 
+def test_build_headers_path_and_query_string_headers_not_mutated() -> None:
+    headers = Headers({"X-Test": "value"})
+    result, *_ = make_test_headers_path_and_query_string(
+        Quart(__name__), "/path", headers
+    )
+    assert headers == Headers({"X-Test": "value"})
+    assert result["User-Agent"] == "Quart"
+    assert result["X-Test"] == "value"
+
+
+async def test_headers_not_mutated_by_client() -> None:
+    app = Quart(__name__)
+
+    @app.route("/", methods=["GET", "POST"])
+    async def index() -> Response:
+        response = jsonify({})
+        response.set_cookie("a", "b")
+        return response
+
+    @app.websocket("/ws")
+    async def ws() -> None:
+        await websocket.accept()
+
+    headers = Headers({"User-Agent": "x", "host": "localhost"})
+    client = Client(app)
+    await client.get("/", headers=headers)
+    await client.post("/", headers=headers, json={})
+    async with client.websocket("/ws", headers=headers):
+        pass
+    assert headers == Headers({"User-Agent": "x", "host": "localhost"})
+
+
 async def test_remote_addr() -> None:
     app = Quart(__name__)
 
@@ -344,10 +377,27 @@ async def test_set_cookie() -> None:
     async def echo() -> Response:
         return jsonify({"foo": request.cookies.get("foo")})
 
+    @app.route("/raw", methods=["GET"])
+    async def raw() -> Response:
+        return jsonify(request.headers.getlist("cookie"))
+
     client = Client(app)
     client.set_cookie("localhost", "foo", "bar")
     response = await client.get("/")
     assert (await response.get_json()) == {"foo": "bar"}
+    client.set_cookie("localhost", "foo", "baz")
+    response = await client.get("/")
+    assert (await response.get_json()) == {"foo": "baz"}
+    client.delete_cookie("localhost", "foo")
+    response = await client.get("/")
+    assert (await response.get_json()) == {"foo": None}
+    client.set_cookie("localhost", "foo", "bar")
+    client.set_cookie("localhost", "baz", "qux")
+    response = await client.get("/raw")
+    assert (await response.get_json()) == ["foo=bar; baz=qux"]
+    client.cookie_jar.clear()
+    response = await client.get("/")
+    assert (await response.get_json()) == {"foo": None}
 
 
 async def test_websocket_bad_request() -> None:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+from io import BytesIO
+from typing import Any
 from urllib.parse import urlencode
 
 import pytest
@@ -9,6 +11,8 @@ from werkzeug.datastructures import Headers
 from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.exceptions import RequestTimeout
 
+from quart.datastructures import FileStorage
+from quart.testing import make_test_body_with_headers
 from quart.testing import no_op_push
 from quart.wrappers.request import Body
 from quart.wrappers.request import Request
@@ -63,6 +67,37 @@ async def test_body_streaming_no_data() -> None:
     assert b"" == await body
 
 
+async def test_body_await_repeatedly() -> None:
+    body = Body(None, None)
+    body.set_result(b"data")
+    data = await body
+    assert data == b"data"
+    assert (await body) is data
+    body.clear()
+    assert b"" == await body
+
+
+async def test_request_get_data_then_multipart_form(http_scope: HTTPScope) -> None:
+    data, headers = make_test_body_with_headers(
+        form={"b": "c"}, files={"a": FileStorage(BytesIO(b"abc"), filename="Quart")}
+    )
+    request = Request(
+        "POST",
+        "http",
+        "/",
+        b"",
+        headers,
+        "",
+        "1.1",
+        http_scope,
+        send_push_promise=no_op_push,
+    )
+    request.body.set_result(data)
+    assert (await request.get_data()) == data
+    assert (await request.form).to_dict() == {"b": "c"}
+    assert (await request.files)["a"].read() == b"abc"
+
+
 async def test_body_exceeds_max_content_length() -> None:
     max_content_length = 5
     body = Body(None, max_content_length)
@@ -165,3 +200,29 @@ async def test_request_send_push_promise(http_scope: HTTPScope) -> None:
     assert len(push_promise[1]) == len(valid_headers)
     for name, value in valid_headers.items():
         assert push_promise[1][name] == value
+
+
+@pytest.mark.parametrize(
+    "body, silent, expected",
+    [
+        (b'{"a": "\xc3\xa9"}', False, {"a": "\u00e9"}),
+        ('{"a": 1}'.encode("utf-16"), False, {"a": 1}),
+        (b'{"a": "\xff"}', True, None),
+    ],
+)
+async def test_request_get_json(
+    body: bytes, silent: bool, expected: Any, http_scope: HTTPScope
+) -> None:
+    request = Request(
+        "POST",
+        "http",
+        "/",
+        b"",
+        Headers({"Content-Type": "application/json"}),
+        "",
+        "1.1",
+        http_scope,
+        send_push_promise=no_op_push,
+    )
+    request.body.set_result(body)
+    assert (await request.get_json(silent=silent)) == expected
@@ -40,7 +40,12 @@ async def _simple_async_generator() -> AsyncGenerator[bytes, None]:
 
 @pytest.mark.parametrize(
     "iterable",
-    [[b"abc", b"def"], (data for data in [b"abc", b"def"]), _simple_async_generator()],
+    [
+        [b"abc", b"def"],
+        (b"abc", b"def"),
+        (data for data in [b"abc", b"def"]),
+        _simple_async_generator(),
+    ],
 )
 async def test_iterable_wrapper(iterable: Any) -> None:
     wrapper = IterableBody(iterable)
@@ -62,6 +67,29 @@ async def test_file_wrapper(tmp_path: Path) -> None:
     assert results == [b"abc", b"def"]
 
 
+async def test_file_wrapper_known_size(tmp_path: Path) -> None:
+    file_ = tmp_path / "file_wrapper"
+    file_.write_text("abcdef")
+    wrapper = FileBody(Path(file_), buffer_size=3, size=4)
+    results = []
+    async with wrapper as response:
+        async for data in response:
+            results.append(data)
+    assert results == [b"abc", b"d"]
+
+
+async def test_file_wrapper_range(tmp_path: Path) -> None:
+    file_ = tmp_path / "file_wrapper"
+    file_.write_text("abcdefgh")
+    wrapper = FileBody(Path(file_), buffer_size=3)
+    await wrapper.make_conditional(1, 6)
+    results = []
+    async with wrapper as response:
+        async for data in response:
+            results.append(data)
+    assert results == [b"bcd", b"ef"]
+
+
 async def test_io_wrapper() -> None:
     wrapper = IOBody(BytesIO(b"abcdef"), buffer_size=3)
     results = []
@@ -86,6 +114,16 @@ async def test_response_body() -> None:
     assert b"Body" == (await response.get_data())
 
 
+async def test_response_body_streamed_as_text() -> None:
+    async def _gen() -> AsyncGenerator[bytes, None]:
+        yield b"caf"
+        yield "é".encode()[:1]
+        yield "é".encode()[1:]
+
+    response = Response(_gen())
+    assert "café" == (await response.get_data(as_text=True))
+
+
 async def test_response_make_conditional(http_scope: HTTPScope) -> None:
     request = Request(
         "GET",